@@ -1,5 +1,6 @@
 import ast
 import glob
+import hashlib
 import json
 import os
 import platform
@@ -14,11 +15,12 @@ import send2trash
 import yaml
 
 from ..utils.display_markdown_message import display_markdown_message
-from ..utils.oi_dir import oi_dir
+from ..utils.oi_dir import oi_cache_dir, oi_dir
 from .historical_profiles import historical_profiles
 
 profile_dir = os.path.join(oi_dir, "profiles")
 user_default_profile_path = os.path.join(profile_dir, "default.yaml")
+profile_cache_dir = os.path.join(oi_cache_dir, "profiles")
 
 here = os.path.abspath(os.path.dirname(__file__))
 oi_default_profiles_path = os.path.join(here, "defaults")
@@ -90,23 +92,7 @@ def get_profile(filename_or_url, profile_path):
 
     # Try local
     if os.path.exists(profile_path):
-        with open(profile_path, "r", encoding="utf-8") as file:
-            if extension == ".py":
-                python_script = file.read()
-
-                # Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`, because we handle that before the script
-                tree = ast.parse(python_script)
-                tree = RemoveInterpreter().visit(tree)
-                python_script = ast.unparse(tree)
-
-                return {
-                    "start_script": python_script,
-                    "version": OI_VERSION,
-                }  # Python scripts are always the latest version
-            elif extension == ".json":
-                return json.load(file)
-            else:
-                return yaml.safe_load(file)
+        return load_profile_file(profile_path)
 
     # Try URL
     response = requests.get(filename_or_url)
@@ -121,6 +107,65 @@ def get_profile(filename_or_url, profile_path):
     raise Exception(f"Profile '{filename_or_url}' not found.")
 
 
+def load_profile_file(profile_path):
+    """
+    Parses a local profile file. Results are cached on disk, keyed by the file's mtime, size and OI_VERSION,
+    so an unchanged profile skips YAML / AST parsing on the next run.
+    """
+    cache_path = os.path.join(
+        profile_cache_dir,
+        hashlib.sha1(os.path.abspath(profile_path).encode("utf-8")).hexdigest()
+        + ".json",
+    )
+    stat = os.stat(profile_path)
+    key = [stat.st_mtime_ns, stat.st_size, OI_VERSION]
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file:
+            cached = json.load(file)
+        if isinstance(cached, dict) and cached.get("key") == key:
+            return cached["profile"]
+    except (OSError, ValueError):
+        # Missing, stale format, or corrupt. Just parse it again
+        pass
+
+    profile = parse_profile_file(profile_path)
+
+    try:
+        serialized = json.dumps({"key": key, "profile": profile})
+        # Only cache profiles that come back exactly the same (YAML allows things like dates and non-string keys)
+        if json.loads(serialized)["profile"] == profile:
+            os.makedirs(profile_cache_dir, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as file:
+                file.write(serialized)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return profile
+
+
+def parse_profile_file(profile_path):
+    extension = os.path.splitext(profile_path)[-1]
+
+    with open(profile_path, "r", encoding="utf-8") as file:
+        if extension == ".py":
+            python_script = file.read()
+
+            # Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`, because we handle that before the script
+            tree = ast.parse(python_script)
+            tree = RemoveInterpreter().visit(tree)
+            python_script = ast.unparse(tree)
+
+            return {
+                "start_script": python_script,
+                "version": OI_VERSION,
+            }  # Python scripts are always the latest version
+        elif extension == ".json":
+            return json.load(file)
+        else:
+            return yaml.safe_load(file)
+
+
 class RemoveInterpreter(ast.NodeTransformer):
     """Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`"""
 
@@ -653,25 +698,8 @@ def get_default_profile(specific_default_profile):
             continue
 
         profile_path = os.path.join(oi_default_profiles_path, filename)
-        extension = os.path.splitext(filename)[-1]
-
-        with open(profile_path, "r", encoding="utf-8") as file:
-            if extension == ".py":
-                python_script = file.read()
-
-                # Remove `from interpreter import interpreter` and `interpreter = OpenInterpreter()`, because we handle that before the script
-                tree = ast.parse(python_script)
-                tree = RemoveInterpreter().visit(tree)
-                python_script = ast.unparse(tree)
-
-                return {
-                    "start_script": python_script,
-                    "version": OI_VERSION,
-                }  # Python scripts are always the latest version
-            elif extension == ".json":
-                return json.load(file)
-            else:
-                return yaml.safe_load(file)
+
+        return load_profile_file(profile_path)
 
 
 def determine_user_version():
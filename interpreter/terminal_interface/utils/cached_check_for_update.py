@@ -0,0 +1,52 @@
+import json
+import os
+import time
+from importlib.metadata import version
+
+from .oi_dir import oi_cache_dir
+
+update_check_path = os.path.join(oi_cache_dir, "update-check.json")
+
+# How long a previous answer from PyPI is trusted before we ask again
+UPDATE_CHECK_TTL = 6 * 60 * 60
+
+
+def cached_check_for_update():
+    """
+    Like `check_for_update`, but reuses the last answer if it's less than `UPDATE_CHECK_TTL` seconds old
+    and was given for the version that's installed now (so upgrading clears the banner right away).
+    """
+    current_version = version("open-interpreter")
+
+    try:
+        with open(update_check_path, "r") as file:
+            cached = json.load(file)
+        if (
+            cached["current_version"] == current_version
+            and time.time() - cached["checked_at"] < UPDATE_CHECK_TTL
+        ):
+            return cached["update_available"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # Only pay for requests/packaging if we actually need to hit the network
+    from .check_for_update import check_for_update
+
+    update_available = check_for_update()
+
+    try:
+        os.makedirs(oi_cache_dir, exist_ok=True)
+        with open(update_check_path, "w") as file:
+            json.dump(
+                {
+                    "checked_at": time.time(),
+                    "current_version": current_version,
+                    "update_available": update_available,
+                },
+                file,
+            )
+    except OSError:
+        # Not being able to cache this is fine, we'll just check again next time
+        pass
+
+    return update_available
@@ -611,3 +611,117 @@ def test_token_counter():
     prompt_tokens_ok = system_tokens + prompt_tokens == prompt_token_test[0]
 
     assert system_tokens_ok and prompt_tokens_ok
+
+
+def test_cached_check_for_update(tmp_path, monkeypatch):
+    import json
+
+    import interpreter.terminal_interface.utils.cached_check_for_update as cache_module
+    import interpreter.terminal_interface.utils.check_for_update as check_module
+
+    calls = []
+
+    def fake_check_for_update():
+        calls.append(True)
+        return True
+
+    update_check_path = tmp_path / "update-check.json"
+    monkeypatch.setattr(check_module, "check_for_update", fake_check_for_update)
+    monkeypatch.setattr(cache_module, "oi_cache_dir", str(tmp_path))
+    monkeypatch.setattr(cache_module, "update_check_path", str(update_check_path))
+    monkeypatch.setattr(cache_module, "version", lambda name: "0.2.5")
+
+    # First call hits "PyPI", second one is answered from the cache
+    assert cache_module.cached_check_for_update()
+    assert cache_module.cached_check_for_update()
+    assert len(calls) == 1
+
+    # Expired
+    cached = json.loads(update_check_path.read_text())
+    cached["checked_at"] -= cache_module.UPDATE_CHECK_TTL + 1
+    update_check_path.write_text(json.dumps(cached))
+    assert cache_module.cached_check_for_update()
+    assert len(calls) == 2
+
+    # Upgraded since the last check
+    monkeypatch.setattr(cache_module, "version", lambda name: "0.2.6")
+    assert cache_module.cached_check_for_update()
+    assert len(calls) == 3
+    assert json.loads(update_check_path.read_text())["current_version"] == "0.2.6"
+
+
+def test_profile_file_cache(tmp_path, monkeypatch):
+    import interpreter.terminal_interface.profiles.profiles as profiles_module
+
+    parses = []
+    parse_profile_file = profiles_module.parse_profile_file
+
+    def counting_parse_profile_file(profile_path):
+        parses.append(profile_path)
+        return parse_profile_file(profile_path)
+
+    monkeypatch.setattr(profiles_module, "profile_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        profiles_module, "parse_profile_file", counting_parse_profile_file
+    )
+
+    profile_path = tmp_path / "test.yaml"
+    profile_path.write_text("llm:\n  model: gpt-4\n")
+
+    # Miss, then hit
+    first = profiles_module.load_profile_file(str(profile_path))
+    first["llm"]["model"] = "mutated by apply_profile"
+    second = profiles_module.load_profile_file(str(profile_path))
+    assert second == {"llm": {"model": "gpt-4"}}
+    assert len(parses) == 1
+
+    # An edit that keeps the mtime still invalidates it, because the size changed
+    stat = os.stat(profile_path)
+    profile_path.write_text("llm:\n  model: gpt-3.5-turbo\n")
+    os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert profiles_module.load_profile_file(str(profile_path)) == {
+        "llm": {"model": "gpt-3.5-turbo"}
+    }
+    assert len(parses) == 2
+
+    # So does a new OI version
+    monkeypatch.setattr(profiles_module, "OI_VERSION", "0.0.0")
+    profiles_module.load_profile_file(str(profile_path))
+    assert len(parses) == 3
+
+
+def test_os_packages_marker(tmp_path, monkeypatch):
+    import sys
+
+    import interpreter.terminal_interface.start_terminal_interface as sti
+
+    checks = []
+    get_missing_packages = sti.get_missing_packages
+
+    def counting_get_missing_packages(packages):
+        checks.append(list(packages))
+        return get_missing_packages(packages)
+
+    marker_path = tmp_path / "os_packages_ok"
+    monkeypatch.setattr(sti, "get_packages_marker_path", lambda: str(marker_path))
+    monkeypatch.setattr(sti, "get_missing_packages", counting_get_missing_packages)
+
+    # Something missing, so no marker
+    assert sti.check_packages(["json", "not_a_real_package"]) == ["not_a_real_package"]
+    assert not marker_path.exists()
+
+    # Nothing missing writes the marker, and the next check is skipped
+    assert sti.check_packages(["json", "os"]) == []
+    assert marker_path.exists()
+    assert sti.check_packages(["json", "os"]) == []
+    assert len(checks) == 2
+
+    # A different package list, environment or Python version checks again
+    assert sti.check_packages(["json"]) == []
+    assert len(checks) == 3
+    monkeypatch.setattr(sys, "prefix", "/some/other/venv")
+    assert sti.check_packages(["json"]) == []
+    assert len(checks) == 4
+    monkeypatch.setattr(sys, "version", "0.0.0")
+    assert sti.check_packages(["json"]) == []
+    assert len(checks) == 5